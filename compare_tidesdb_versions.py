@@ -16,11 +16,25 @@ import pandas as pd
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+from matplotlib import font_manager
 import numpy as np
 import sys
+import argparse
 import os
 import re
+import gc
+import io
+import hashlib
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'  # multithreaded parser
+except ImportError:
+    CSV_ENGINE = 'c'
 
 NEW_VER = '#1565C0'      # Blue for newer version
 OLD_VER = '#9E9E9E'      # Grey for older version
@@ -29,23 +43,58 @@ REGRESS = '#EF5350'      # Red for regression
 NEW_VER_L = '#64B5F6'
 OLD_VER_L = '#E0E0E0'
 OUT_DIR = 'version_comparison_plots'
+_FIG_CACHE = {}  # figsize -> Figure, reused across plots
+_WRITER = None  # background PNG file writer, created on first save
+_PENDING = []
+_INPUT_KEY = b''  # digest of the plotted data and this script; see input_key()
+DPI = 200  # PNG resolution; override with --dpi=N
+CHUNKED_READ_BYTES = 200_000_000  # stream CSVs larger than this
+CHUNK_ROWS = 200_000
+# Metric columns read from the CSV; the rest are skipped at parse time
+METRICS = ['ops_per_sec', 'avg_latency_us', 'p50_us', 'p95_us', 'p99_us',
+           'peak_rss_mb', 'disk_write_mb', 'cpu_percent', 'db_size_mb', 'write_amp']
+STAMP_RE = re.compile(r'(\d{8})_(\d{6})')  # results_YYYYMMDD_HHMMSS.csv
+
+
+@lru_cache(maxsize=None)
+def sans_font():
+    """Concrete sans-serif family name, so text skips the fallback-list search."""
+    path = font_manager.findfont(font_manager.FontProperties(family=['sans-serif']))
+    return font_manager.FontProperties(fname=path).get_name()
 
 
 def setup_style():
     plt.rcParams.update({
         'figure.facecolor': 'white', 'axes.facecolor': '#FAFAFA',
         'axes.grid': True, 'grid.alpha': 0.25, 'grid.linestyle': '--',
-        'font.family': 'sans-serif', 'font.size': 10,
+        'font.family': sans_font(), 'font.size': 10,
         'axes.titlesize': 13, 'axes.titleweight': 'bold', 'axes.labelsize': 11,
         'figure.titlesize': 15, 'figure.titleweight': 'bold',
         'legend.fontsize': 10, 'xtick.labelsize': 9, 'ytick.labelsize': 9,
+        'savefig.dpi': DPI,
+        # Fewer path segments per draw; cached figures stay open on purpose
+        'path.simplify': True, 'path.simplify_threshold': 1.0,
+        'agg.path.chunksize': 10000, 'figure.max_open_warning': 0,
+        # Unhinted glyphs rasterize faster and are indistinguishable at this DPI
+        'text.hinting': 'none', 'text.antialiased': True,
     })
+    warm_fonts()
+
+
+@lru_cache(maxsize=None)
+def warm_fonts():
+    """Load the regular and bold faces once, before any worker forks."""
+    fig = plt.figure(figsize=(1, 1))
+    fig.text(0, 0, '0123456789.%+-x KMGB ops/s')
+    fig.text(0, .5, '0123456789.%+-x KMGB ops/s', weight='bold')
+    fig.canvas.draw()
+    plt.close(fig)
 
 
 def extract_date_from_filename(filepath):
     """Extract date from filename like tidesdb_rocksdb_benchmark_results_20260217_113922.csv"""
     basename = os.path.basename(filepath)
-    match = re.search(r'(\d{8})_(\d{6})', basename)
+    match = STAMP_RE.search(basename)
     if match:
         date_str = match.group(1)
         time_str = match.group(2)
@@ -53,24 +102,76 @@ def extract_date_from_filename(filepath):
     return None
 
 
+def main_rows(df):
+    """Keep TidesDB rows, minus populate phases and ITER, with one combined mask."""
+    # Match the distinct test names once, then broadcast by code (-1 = NaN -> False).
+    # astype(str): pyarrow types the categories of a header-only file as float
+    names = df['test_name'].cat
+    hit = np.asarray(names.categories.astype(str).str.contains('_populate'), dtype=bool)
+    populate = np.append(hit, False)[names.codes.to_numpy()]
+    keep = ((df['engine'] == 'tidesdb').to_numpy(dtype=bool)
+            & ~populate
+            & (df['operation'] != 'ITER').to_numpy(dtype=bool))
+    return df[keep]
+
+
+def used_columns(csv_path):
+    """Header columns the plots read; everything else is never parsed."""
+    header = pd.read_csv(csv_path, nrows=0).columns
+    return [c for c in header if c in ('engine', 'test_name', 'operation') or c in METRICS]
+
+
 def load_data(csv_path):
-    """Load and filter benchmark data for TidesDB only."""
-    df = pd.read_csv(csv_path)
-    df = df[df['engine'] == 'tidesdb']
-    main = df[~df['test_name'].str.contains('_populate', na=False)]
-    main = main[main['operation'] != 'ITER'].copy()
-    return main
+    """Load and filter benchmark data for TidesDB only, indexed by (test_name, operation)."""
+    usecols = used_columns(csv_path)
+    # Metrics only feed chart labels, so float32 halves them at no visible cost
+    dtype = {c: 'float32' for c in usecols if c in METRICS}
+    dtype.update({'test_name': 'category', 'engine': 'category', 'operation': 'category'})
+    keys = ['test_name', 'operation']
+    if os.path.getsize(csv_path) > CHUNKED_READ_BYTES:
+        # Reduce each chunk to its first row per group as it streams in, so
+        # memory tracks the number of tests rather than the length of the log
+        chunks = pd.read_csv(csv_path, chunksize=CHUNK_ROWS, usecols=usecols, dtype=dtype)
+        parts, rows = [], 0
+        for c in chunks:
+            c = main_rows(c)
+            rows += len(c)
+            parts.append(c.drop_duplicates(keys))
+        main = pd.concat(parts, ignore_index=True).astype(dtype)
+    else:
+        main = main_rows(pd.read_csv(csv_path, engine=CSV_ENGINE, usecols=usecols, dtype=dtype))
+        rows = len(main)
+    # Index the first row of each (test_name, operation), NaNs included, so
+    # val() is a hashed lookup instead of a full-table scan
+    df = main.drop_duplicates(keys).set_index(keys)
+    df.attrs['rows'] = rows  # TidesDB result rows, before deduplication
+    return df
 
 
 def val(df, test_name, operation, column):
     """Get value from dataframe for a specific test/operation/column."""
-    row = df[(df['test_name'] == test_name) & (df['operation'] == operation)]
-    if row.empty:
+    try:
+        v = df.at[(test_name, operation), column]
+    except KeyError:
         return 0
-    v = row.iloc[0][column]
     return 0 if pd.isna(v) else float(v)
 
 
+def vals(df, keys, column):
+    """Vectorized val() over a list of (test_name, operation) keys."""
+    if not keys or column not in df.columns:
+        return np.zeros(len(keys))
+    return df[column].reindex(keys).fillna(0).to_numpy(dtype=float)
+
+
+def filter_available(df_new, df_old, tests, column='ops_per_sec', op=None):
+    """Filter tests to those where either version has data in column."""
+    keys = [(t[0], op or t[1]) for t in tests]
+    has = (vals(df_new, keys, column) > 0) | (vals(df_old, keys, column) > 0)
+    return [t for t, keep in zip(tests, has) if keep]
+
+
+@lru_cache(maxsize=1024)
 def fmt_v(v):
     """Format value for display."""
     if v >= 1_000_000:
@@ -82,6 +183,20 @@ def fmt_v(v):
     return f'{v:.2f}'
 
 
+def fmt_vs(values, decimal=False):
+    """Vectorized fmt_v() for bar labels; non-positive values get no label."""
+    v = np.asarray(values, dtype=float)
+    if decimal:
+        text = np.char.mod('%.2f', v)
+    else:
+        text = np.select([v >= 1e6, v >= 1e3, v >= 10],
+                         [np.char.mod('%.2fM', v / 1e6), np.char.mod('%.1fK', v / 1e3),
+                          np.char.mod('%.0f', v)],
+                         np.char.mod('%.2f', v))
+    return np.where(v > 0, text, '')
+
+
+@lru_cache(maxsize=1024)
 def fmt_pct(pct):
     """Format percentage change."""
     if pct >= 0:
@@ -99,7 +214,7 @@ def calc_change(new_val, old_val, higher_is_better=True):
 
 
 def paired_bars(ax, labels, new_vals, old_vals, ylabel, title, new_label, old_label, 
-                decimal=False, rotation=25, higher_is_better=True):
+                decimal=False, rotation=25, higher_is_better=True, legend=True):
     """Draw paired bar chart comparing two versions."""
     x = np.arange(len(labels))
     w = 0.35
@@ -109,17 +224,12 @@ def paired_bars(ax, labels, new_vals, old_vals, ylabel, title, new_label, old_la
     ax.set_title(title)
     ax.set_xticks(x)
     ax.set_xticklabels(labels, rotation=rotation, ha='right')
-    ax.legend(loc='best')
+    if legend:
+        ax.legend(loc='best')
     ax.set_axisbelow(True)
 
     for bars, c in [(b1, NEW_VER), (b2, '#616161')]:
-        for bar in bars:
-            h = bar.get_height()
-            if h > 0:
-                txt = f'{h:.2f}' if decimal else fmt_v(h)
-                ax.annotate(txt, xy=(bar.get_x() + bar.get_width()/2, h),
-                            xytext=(0, 4), textcoords='offset points',
-                            ha='center', va='bottom', fontsize=7, color=c, fontweight='bold')
+        ax.bar_label(bars, labels=fmt_vs(bars.datavalues, decimal), padding=4, fontsize=7, color=c, fontweight='bold')
     
     for i, (nv, ov) in enumerate(zip(new_vals, old_vals)):
         if nv > 0 and ov > 0:
@@ -131,12 +241,73 @@ def paired_bars(ax, labels, new_vals, old_vals, ylabel, title, new_label, old_la
                             ha='center', va='bottom', fontsize=8, color=color, fontweight='bold')
 
 
+def get_fig(figsize, nrows=1, ncols=1):
+    """Reuse one figure per size instead of building a new one for every plot."""
+    fig = _FIG_CACHE.get(figsize)
+    if fig is None:
+        fig = _FIG_CACHE[figsize] = plt.figure(figsize=figsize)
+    else:
+        fig.clear()
+    return fig, fig.subplots(nrows, ncols)
+
+
+def shared_legend(fig, ax):
+    """One legend under the suptitle for grids; returns the top for tight_layout."""
+    h = fig.get_figheight()
+    fig.legend(*ax.get_legend_handles_labels(), loc='upper center', ncol=2,
+               bbox_to_anchor=(0.5, .98 - .3 / h))
+    return .98 - .5 / h
+
+
 def save(fig, name):
-    fig.savefig(f'{OUT_DIR}/{name}', dpi=200, bbox_inches='tight')
-    plt.close(fig)
+    global _WRITER
+    # Fast zlib level: the PNG deflate dominated save time, files grow modestly.
+    # No bbox_inches='tight': every plot already ran tight_layout, and the
+    # tight bbox would cost an extra draw pass per save.
+    # The encoded bytes go to disk on a writer thread so file I/O overlaps the next plot.
+    # A sidecar hash of the inputs lets reruns on the same data skip the render.
+    path, tag = f'{OUT_DIR}/{name}', f'{OUT_DIR}/.{name}.hash'
+    key = hashlib.blake2b(_INPUT_KEY + name.encode(), digest_size=8).hexdigest()
+    if os.path.exists(path) and os.path.exists(tag):
+        with open(tag) as f:
+            if f.read() == key:
+                print(f'  = {name} (unchanged)')
+                return
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', pil_kwargs={'compress_level': 1})
+    if _WRITER is None:
+        _WRITER = ThreadPoolExecutor(max_workers=1)
+    _PENDING.append(_WRITER.submit(write_file, path, buf.getvalue(), tag, key))
     print(f'  + {name}')
 
 
+def write_file(path, data, tag, key):
+    with open(path, 'wb') as f:
+        f.write(data)
+    with open(tag, 'w') as f:  # only after the PNG is complete
+        f.write(key)
+
+
+def input_key(frames, *extra):
+    """Digest of the data, labels, this script and matplotlib version."""
+    h = hashlib.blake2b(digest_size=16)
+    for df in frames:
+        h.update(str(list(df.columns)).encode())
+        h.update(pd.util.hash_pandas_object(df).to_numpy().tobytes())
+    for x in extra:
+        h.update(str(x).encode())
+    with open(__file__, 'rb') as f:
+        h.update(f.read())
+    h.update(matplotlib.__version__.encode())
+    return h.digest()
+
+
+def flush_writes():
+    """Wait for queued PNG writes, re-raising any I/O error."""
+    while _PENDING:
+        _PENDING.pop(0).result()
+
+
 def plot_change_summary(df_new, df_old, new_label, old_label):
     """Create a horizontal bar chart showing % change for key benchmarks."""
     tests = [
@@ -158,22 +329,23 @@ def plot_change_summary(df_new, df_old, new_label, old_label):
         ('batch_10000_10M_t8', 'PUT', 'Batch 10000 (10M, 8t)', True),
     ]
     
-    labels, changes, colors = [], [], []
-    for tn, op, lbl, higher_better in tests:
-        new_v = val(df_new, tn, op, 'ops_per_sec')
-        old_v = val(df_old, tn, op, 'ops_per_sec')
-        if new_v > 0 and old_v > 0:
-            pct, is_imp = calc_change(new_v, old_v, higher_better)
-            if abs(pct) < 1000:  
-                labels.append(lbl)
-                changes.append(pct)
-                colors.append(IMPROVE if is_imp else REGRESS)
+    keys = [t[:2] for t in tests]
+    new_v = vals(df_new, keys, 'ops_per_sec')
+    old_v = vals(df_old, keys, 'ops_per_sec')
+    both = (new_v > 0) & (old_v > 0)
+    pct = np.divide(new_v - old_v, old_v, out=np.zeros_like(new_v), where=both) * 100
+    keep = both & (np.abs(pct) < 1000)
+    higher_better = np.array([t[3] for t in tests])
+    is_imp = np.where(higher_better, pct > 0, pct < 0)
+    labels = [t[2] for t, k in zip(tests, keep) if k]
+    changes = pct[keep]
+    colors = np.where(is_imp[keep], IMPROVE, REGRESS)
     
     if not labels:
         print('  - 00_change_summary.png (no data, skipped)')
         return
     
-    fig, ax = plt.subplots(figsize=(14, max(8, len(labels) * 0.4)))
+    fig, ax = get_fig((14, max(8, len(labels) * 0.4)))
     fig.suptitle(f'TidesDB Performance Change: {old_label} → {new_label}\n(Throughput % Change)')
     
     y = np.arange(len(labels))
@@ -185,20 +357,18 @@ def plot_change_summary(df_new, df_old, new_label, old_label):
     ax.invert_yaxis()
     ax.set_axisbelow(True)
     
-    for bar, change in zip(bars, changes):
-        x_pos = bar.get_width()
-        offset = 5 if x_pos >= 0 else -5
-        ha = 'left' if x_pos >= 0 else 'right'
-        ax.text(x_pos + offset * 0.01 * max(abs(c) for c in changes), 
-                bar.get_y() + bar.get_height()/2,
-                fmt_pct(change), va='center', ha=ha, fontsize=9, fontweight='bold',
-                color=IMPROVE if change >= 0 else REGRESS)
+    text = np.char.mod('%+.1f%%', changes)  # same strings as fmt_pct()
+    for mask, c in [(changes >= 0, IMPROVE), (changes < 0, REGRESS)]:
+        ax.bar_label(bars, labels=np.where(mask, text, ''), padding=5,
+                     fontsize=9, fontweight='bold', color=c)
+    ax.margins(x=.08)  # room for the labels past the longest bars
     
     ax.text(0.98, 0.02, '▲ Green = Improvement | ▼ Red = Regression',
             transform=ax.transAxes, ha='right', va='bottom', fontsize=9,
             style='italic', color='#757575',
             bbox=dict(boxstyle='round,pad=0.3', fc='white', ec='#E0E0E0'))
     
+    fig.tight_layout()
     save(fig, '00_change_summary.png')
 
 
@@ -209,19 +379,19 @@ def plot_write_comparison(df_new, df_old, new_label, old_label):
         ('write_zipfian_5M_t8_b1000', 'Zipfian\n5M'),
     ]
     
-    avail = [(t[0], t[1]) for t in tests 
-             if val(df_new, t[0], 'PUT', 'ops_per_sec') > 0 or val(df_old, t[0], 'PUT', 'ops_per_sec') > 0]
+    avail = filter_available(df_new, df_old, tests, op='PUT')
     
     if not avail:
         print('  - 01_write_comparison.png (no data, skipped)')
         return
     
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = get_fig((12, 6))
     fig.suptitle('TidesDB Write Throughput Comparison')
     
     lbl = [t[1] for t in avail]
-    new_vals = [val(df_new, t[0], 'PUT', 'ops_per_sec') for t in avail]
-    old_vals = [val(df_old, t[0], 'PUT', 'ops_per_sec') for t in avail]
+    keys = [(t[0], 'PUT') for t in avail]
+    new_vals = vals(df_new, keys, 'ops_per_sec')
+    old_vals = vals(df_old, keys, 'ops_per_sec')
     
     paired_bars(ax, lbl, new_vals, old_vals, 'ops/sec', 'Write Throughput', 
                 new_label, old_label, higher_is_better=True)
@@ -241,10 +411,8 @@ def plot_mixed_comparison(df_new, df_old, new_label, old_label):
         ('mixed_zipfian_5M_t8_b1000', 'GET', 'Zipfian\n5M'),
     ]
     
-    put_avail = [t for t in put_tests 
-                 if val(df_new, t[0], t[1], 'ops_per_sec') > 0 or val(df_old, t[0], t[1], 'ops_per_sec') > 0]
-    get_avail = [t for t in get_tests 
-                 if val(df_new, t[0], t[1], 'ops_per_sec') > 0 or val(df_old, t[0], t[1], 'ops_per_sec') > 0]
+    put_avail = filter_available(df_new, df_old, put_tests)
+    get_avail = filter_available(df_new, df_old, get_tests)
     
     if not put_avail and not get_avail:
         print('  - 02_mixed_comparison.png (no data, skipped)')
@@ -256,15 +424,16 @@ def plot_mixed_comparison(df_new, df_old, new_label, old_label):
     if get_avail:
         panels.append((get_avail, 'Mixed — Read Side'))
     
-    fig, axes = plt.subplots(1, len(panels), figsize=(8 * len(panels), 6))
+    fig, axes = get_fig((8 * len(panels), 6), 1, len(panels))
     if len(panels) == 1:
         axes = [axes]
     fig.suptitle('TidesDB Mixed Workload Comparison')
     
     for ax, (tests, title) in zip(axes, panels):
         lbl = [t[2] for t in tests]
-        new_vals = [val(df_new, t[0], t[1], 'ops_per_sec') for t in tests]
-        old_vals = [val(df_old, t[0], t[1], 'ops_per_sec') for t in tests]
+        keys = [t[:2] for t in tests]
+        new_vals = vals(df_new, keys, 'ops_per_sec')
+        old_vals = vals(df_old, keys, 'ops_per_sec')
         paired_bars(ax, lbl, new_vals, old_vals, 'ops/sec', title, new_label, old_label)
     
     fig.tight_layout(rect=[0, 0, 1, .93])
@@ -280,19 +449,19 @@ def plot_delete_comparison(df_new, df_old, new_label, old_label):
         ('delete_random_5M_t8_b1000', 'Random b1000'),
     ]
     
-    avail = [t for t in tests 
-             if val(df_new, t[0], 'DELETE', 'ops_per_sec') > 0 or val(df_old, t[0], 'DELETE', 'ops_per_sec') > 0]
+    avail = filter_available(df_new, df_old, tests, op='DELETE')
     
     if not avail:
         print('  - 03_delete_comparison.png (no data, skipped)')
         return
     
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = get_fig((12, 6))
     fig.suptitle('TidesDB Delete Throughput Comparison')
     
     lbl = [t[1] for t in avail]
-    new_vals = [val(df_new, t[0], 'DELETE', 'ops_per_sec') for t in avail]
-    old_vals = [val(df_old, t[0], 'DELETE', 'ops_per_sec') for t in avail]
+    keys = [(t[0], 'DELETE') for t in avail]
+    new_vals = vals(df_new, keys, 'ops_per_sec')
+    old_vals = vals(df_old, keys, 'ops_per_sec')
     
     paired_bars(ax, lbl, new_vals, old_vals, 'ops/sec', 'Delete Throughput', 
                 new_label, old_label, higher_is_better=True)
@@ -309,19 +478,19 @@ def plot_seek_comparison(df_new, df_old, new_label, old_label):
         ('seek_zipfian_5M_t8', 'Zipfian'),
     ]
     
-    avail = [t for t in tests 
-             if val(df_new, t[0], 'SEEK', 'ops_per_sec') > 0 or val(df_old, t[0], 'SEEK', 'ops_per_sec') > 0]
+    avail = filter_available(df_new, df_old, tests, op='SEEK')
     
     if not avail:
         print('  - 04_seek_comparison.png (no data, skipped)')
         return
     
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = get_fig((12, 6))
     fig.suptitle('TidesDB Seek Throughput Comparison')
     
     lbl = [t[1] for t in avail]
-    new_vals = [val(df_new, t[0], 'SEEK', 'ops_per_sec') for t in avail]
-    old_vals = [val(df_old, t[0], 'SEEK', 'ops_per_sec') for t in avail]
+    keys = [(t[0], 'SEEK') for t in avail]
+    new_vals = vals(df_new, keys, 'ops_per_sec')
+    old_vals = vals(df_old, keys, 'ops_per_sec')
     
     paired_bars(ax, lbl, new_vals, old_vals, 'ops/sec', 'Seek Throughput', 
                 new_label, old_label, higher_is_better=True)
@@ -337,19 +506,19 @@ def plot_range_comparison(df_new, df_old, new_label, old_label):
         ('range_seq_100_1M_t8', 'Seq 100\n1M'),
     ]
     
-    avail = [t for t in tests 
-             if val(df_new, t[0], 'RANGE', 'ops_per_sec') > 0 or val(df_old, t[0], 'RANGE', 'ops_per_sec') > 0]
+    avail = filter_available(df_new, df_old, tests, op='RANGE')
     
     if not avail:
         print('  - 05_range_comparison.png (no data, skipped)')
         return
     
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = get_fig((12, 6))
     fig.suptitle('TidesDB Range Scan Throughput Comparison')
     
     lbl = [t[1] for t in avail]
-    new_vals = [val(df_new, t[0], 'RANGE', 'ops_per_sec') for t in avail]
-    old_vals = [val(df_old, t[0], 'RANGE', 'ops_per_sec') for t in avail]
+    keys = [(t[0], 'RANGE') for t in avail]
+    new_vals = vals(df_new, keys, 'ops_per_sec')
+    old_vals = vals(df_old, keys, 'ops_per_sec')
     
     paired_bars(ax, lbl, new_vals, old_vals, 'ops/sec', 'Range Scan Throughput', 
                 new_label, old_label, higher_is_better=True)
@@ -363,19 +532,19 @@ def plot_batch_comparison(df_new, df_old, new_label, old_label):
     names = ['batch_1_10M_t8', 'batch_10_10M_t8', 'batch_100_10M_t8',
              'batch_1000_10M_t8', 'batch_10000_10M_t8']
     
-    avail = [(b, n) for b, n in zip(batches, names) 
-             if val(df_new, n, 'PUT', 'ops_per_sec') > 0 or val(df_old, n, 'PUT', 'ops_per_sec') > 0]
+    avail = [(b, n) for n, b in filter_available(df_new, df_old, list(zip(names, batches)), op='PUT')]
     
     if not avail:
         print('  - 06_batch_comparison.png (no data, skipped)')
         return
     
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = get_fig((12, 6))
     fig.suptitle('TidesDB Batch Size Scaling Comparison')
     
     batch_sizes = [b for b, n in avail]
-    new_vals = [val(df_new, n, 'PUT', 'ops_per_sec') for b, n in avail]
-    old_vals = [val(df_old, n, 'PUT', 'ops_per_sec') for b, n in avail]
+    keys = [(n, 'PUT') for b, n in avail]
+    new_vals = vals(df_new, keys, 'ops_per_sec')
+    old_vals = vals(df_old, keys, 'ops_per_sec')
     
     ax.plot(batch_sizes, new_vals, 'o-', color=NEW_VER, lw=2.5, ms=8, label=new_label, zorder=3)
     ax.plot(batch_sizes, old_vals, 's--', color=OLD_VER, lw=2.5, ms=8, label=old_label, zorder=3)
@@ -411,19 +580,19 @@ def plot_value_size_comparison(df_new, df_old, new_label, old_label):
         ('write_large_values_1M_k256_v4096_t8_b1000', '4KB val\n1M'),
     ]
     
-    avail = [t for t in tests 
-             if val(df_new, t[0], 'PUT', 'ops_per_sec') > 0 or val(df_old, t[0], 'PUT', 'ops_per_sec') > 0]
+    avail = filter_available(df_new, df_old, tests, op='PUT')
     
     if not avail:
         print('  - 07_value_size_comparison.png (no data, skipped)')
         return
     
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = get_fig((12, 6))
     fig.suptitle('TidesDB Value Size Impact Comparison')
     
     lbl = [t[1] for t in avail]
-    new_vals = [val(df_new, t[0], 'PUT', 'ops_per_sec') for t in avail]
-    old_vals = [val(df_old, t[0], 'PUT', 'ops_per_sec') for t in avail]
+    keys = [(t[0], 'PUT') for t in avail]
+    new_vals = vals(df_new, keys, 'ops_per_sec')
+    old_vals = vals(df_old, keys, 'ops_per_sec')
     
     paired_bars(ax, lbl, new_vals, old_vals, 'ops/sec', 'Value Size Impact on Write Throughput', 
                 new_label, old_label, higher_is_better=True)
@@ -442,19 +611,19 @@ def plot_latency_comparison(df_new, df_old, new_label, old_label):
         ('delete_random_5M_t8_b1000', 'DELETE', 'Delete'),
     ]
     
-    avail = [t for t in tests 
-             if val(df_new, t[0], t[1], 'avg_latency_us') > 0 or val(df_old, t[0], t[1], 'avg_latency_us') > 0]
+    avail = filter_available(df_new, df_old, tests, 'avg_latency_us')
     
     if not avail:
         print('  - 08_latency_comparison.png (no data, skipped)')
         return
     
-    fig, ax = plt.subplots(figsize=(14, 6))
+    fig, ax = get_fig((14, 6))
     fig.suptitle('TidesDB Average Latency Comparison (Lower is Better)')
     
     lbl = [t[2] for t in avail]
-    new_vals = [val(df_new, t[0], t[1], 'avg_latency_us') for t in avail]
-    old_vals = [val(df_old, t[0], t[1], 'avg_latency_us') for t in avail]
+    keys = [t[:2] for t in avail]
+    new_vals = vals(df_new, keys, 'avg_latency_us')
+    old_vals = vals(df_old, keys, 'avg_latency_us')
     
     paired_bars(ax, lbl, new_vals, old_vals, 'Avg Latency (us)', 'Average Latency', 
                 new_label, old_label, higher_is_better=False)
@@ -470,26 +639,29 @@ def plot_latency_percentiles_comparison(df_new, df_old, new_label, old_label):
         ('delete_random_5M_t8_b1000', 'DELETE', 'Delete'),
     ]
     
-    avail = [w for w in workloads 
-             if val(df_new, w[0], w[1], 'p50_us') > 0 or val(df_old, w[0], w[1], 'p50_us') > 0]
+    avail = filter_available(df_new, df_old, workloads, 'p50_us')
     
     if not avail:
         print('  - 09_latency_percentiles_comparison.png (no data, skipped)')
         return
     
-    fig, axes = plt.subplots(1, len(avail), figsize=(6 * len(avail), 6))
+    fig, axes = get_fig((6 * len(avail), 6), 1, len(avail))
     if len(avail) == 1:
         axes = [axes]
     fig.suptitle('TidesDB Latency Percentiles Comparison (p50/p95/p99)')
     
-    for ax, (tn, op, title) in zip(axes, avail):
-        pcts = ['p50_us', 'p95_us', 'p99_us']
-        new_vals = [val(df_new, tn, op, p) for p in pcts]
-        old_vals = [val(df_old, tn, op, p) for p in pcts]
+    # One (workload x percentile) block per version instead of a lookup per bar
+    keys = [w[:2] for w in avail]
+    pcts = ['p50_us', 'p95_us', 'p99_us']
+    sub_new = df_new.reindex(keys)
+    sub_old = df_old.reindex(keys)
+    new_pct = np.column_stack([vals(sub_new, keys, p) for p in pcts])
+    old_pct = np.column_stack([vals(sub_old, keys, p) for p in pcts])
+    for ax, (_, _, title), new_vals, old_vals in zip(axes, avail, new_pct, old_pct):
         paired_bars(ax, ['p50', 'p95', 'p99'], new_vals, old_vals, 'Latency (us)', title, 
-                    new_label, old_label, rotation=0, higher_is_better=False)
+                    new_label, old_label, rotation=0, higher_is_better=False, legend=False)
     
-    fig.tight_layout(rect=[0, 0, 1, .93])
+    fig.tight_layout(rect=[0, 0, 1, shared_legend(fig, axes[0])])
     save(fig, '09_latency_percentiles_comparison.png')
 
 
@@ -502,19 +674,19 @@ def plot_write_amp_comparison(df_new, df_old, new_label, old_label):
         ('write_large_values_1M_k256_v4096_t8_b1000', 'PUT', 'Large'),
     ]
     
-    avail = [t for t in tests 
-             if val(df_new, t[0], t[1], 'write_amp') > 0 or val(df_old, t[0], t[1], 'write_amp') > 0]
+    avail = filter_available(df_new, df_old, tests, 'write_amp')
     
     if not avail:
         print('  - 10_write_amp_comparison.png (no data, skipped)')
         return
     
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = get_fig((12, 6))
     fig.suptitle('TidesDB Write Amplification Comparison (Lower is Better)')
     
     lbl = [t[2] for t in avail]
-    new_vals = [val(df_new, t[0], t[1], 'write_amp') for t in avail]
-    old_vals = [val(df_old, t[0], t[1], 'write_amp') for t in avail]
+    keys = [t[:2] for t in avail]
+    new_vals = vals(df_new, keys, 'write_amp')
+    old_vals = vals(df_old, keys, 'write_amp')
     
     paired_bars(ax, lbl, new_vals, old_vals, 'Write Amplification', 'Write Amplification', 
                 new_label, old_label, decimal=True, higher_is_better=False)
@@ -531,17 +703,19 @@ def plot_resource_comparison(df_new, df_old, new_label, old_label):
         ('write_large_values_1M_k256_v4096_t8_b1000', 'PUT', 'Large Val'),
     ]
     
-    avail = [t for t in tests 
-             if val(df_new, t[0], t[1], 'peak_rss_mb') > 0 or val(df_old, t[0], t[1], 'peak_rss_mb') > 0]
+    avail = filter_available(df_new, df_old, tests, 'peak_rss_mb')
     
     if not avail:
         print('  - 11_resource_comparison.png (no data, skipped)')
         return
     
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    fig, axes = get_fig((16, 12), 2, 2)
     fig.suptitle('TidesDB Resource Usage Comparison')
     
     lbl = [t[2] for t in avail]
+    keys = [t[:2] for t in avail]
+    sub_new = df_new.reindex(keys)  # one row selection shared by every panel
+    sub_old = df_old.reindex(keys)
     metrics = [
         (axes[0, 0], 'peak_rss_mb', 'Peak RSS (MB)', 'Memory Usage', False),
         (axes[0, 1], 'disk_write_mb', 'Disk Write (MB)', 'Disk Write Volume', False),
@@ -550,12 +724,12 @@ def plot_resource_comparison(df_new, df_old, new_label, old_label):
     ]
     
     for ax, col, ylabel, title, higher_better in metrics:
-        new_vals = [val(df_new, t[0], t[1], col) for t in avail]
-        old_vals = [val(df_old, t[0], t[1], col) for t in avail]
+        new_vals = vals(sub_new, keys, col)
+        old_vals = vals(sub_old, keys, col)
         paired_bars(ax, lbl, new_vals, old_vals, ylabel, title, 
-                    new_label, old_label, higher_is_better=higher_better)
+                    new_label, old_label, higher_is_better=higher_better, legend=False)
     
-    fig.tight_layout(rect=[0, 0, 1, .95])
+    fig.tight_layout(rect=[0, 0, 1, shared_legend(fig, axes[0, 0])])
     save(fig, '11_resource_comparison.png')
 
 
@@ -588,31 +762,28 @@ def generate_text_report(df_new, df_old, new_label, old_label, new_csv, old_csv)
         ('batch_10000_10M_t8', 'PUT', 'Batch 10000 (10M, 8t)'),
     ]
     
-    improvements = []
-    regressions = []
-    unchanged = []
-    
-    for tn, op, lbl in tests:
-        new_v = val(df_new, tn, op, 'ops_per_sec')
-        old_v = val(df_old, tn, op, 'ops_per_sec')
-        if new_v > 0 and old_v > 0:
-            pct, is_imp = calc_change(new_v, old_v, True)
-            if abs(pct) < 1000:
-                entry = {
-                    'name': lbl,
-                    'old': old_v,
-                    'new': new_v,
-                    'pct': pct,
-                }
-                if abs(pct) < 1:
-                    unchanged.append(entry)
-                elif is_imp:
-                    improvements.append(entry)
-                else:
-                    regressions.append(entry)
-    
-    improvements.sort(key=lambda x: x['pct'], reverse=True)
-    regressions.sort(key=lambda x: x['pct'])
+    # Classify every benchmark in one vectorized pass, as in plot_change_summary
+    keys = [t[:2] for t in tests]
+    new_v = vals(df_new, keys, 'ops_per_sec')
+    old_v = vals(df_old, keys, 'ops_per_sec')
+    both = (new_v > 0) & (old_v > 0)
+    pct = np.divide(new_v - old_v, old_v, out=np.zeros_like(new_v), where=both) * 100
+    keep = both & (np.abs(pct) < 1000)
+    flat = keep & (np.abs(pct) < 1)
+    # Format every table row up front with the array formatters, then select
+    names = [t[2] for t in tests]
+    rows = [f"{n:<45} {o:<15} {w:<15} {c:>10}" for n, o, w, c in
+            zip(names, fmt_vs(old_v), fmt_vs(new_v), np.char.mod('%+.1f%%', pct))]
+    
+    def pick(lines, mask, order=()):
+        idx = np.flatnonzero(mask)
+        if len(order):
+            idx = idx[np.argsort(order[idx], kind='stable')]
+        return [lines[i] for i in idx]
+    
+    improvements = pick(rows, keep & ~flat & (pct > 0), -pct)
+    regressions = pick(rows, keep & ~flat & (pct <= 0), pct)
+    unchanged = pick(names, flat)
     
     report = []
     report.append("=" * 80)
@@ -637,8 +808,7 @@ def generate_text_report(df_new, df_old, new_label, old_label, new_csv, old_csv)
         report.append("=" * 80)
         report.append(f"{'Benchmark':<45} {'Old (ops/s)':<15} {'New (ops/s)':<15} {'Change':>10}")
         report.append("-" * 80)
-        for entry in improvements:
-            report.append(f"{entry['name']:<45} {fmt_v(entry['old']):<15} {fmt_v(entry['new']):<15} {fmt_pct(entry['pct']):>10}")
+        report.extend(improvements)
     
     if regressions:
         report.append("\n" + "=" * 80)
@@ -646,15 +816,13 @@ def generate_text_report(df_new, df_old, new_label, old_label, new_csv, old_csv)
         report.append("=" * 80)
         report.append(f"{'Benchmark':<45} {'Old (ops/s)':<15} {'New (ops/s)':<15} {'Change':>10}")
         report.append("-" * 80)
-        for entry in regressions:
-            report.append(f"{entry['name']:<45} {fmt_v(entry['old']):<15} {fmt_v(entry['new']):<15} {fmt_pct(entry['pct']):>10}")
+        report.extend(regressions)
     
     if unchanged:
         report.append("\n" + "=" * 80)
         report.append(f"{'UNCHANGED (< 1% change)':^80}")
         report.append("=" * 80)
-        for entry in unchanged:
-            report.append(f"  {entry['name']}")
+        report.extend(f"  {name}" for name in unchanged)
     
     report.append("\n" + "=" * 80)
     
@@ -668,17 +836,95 @@ def generate_text_report(df_new, df_old, new_label, old_label, new_csv, old_csv)
     print("\n" + report_text)
 
 
+PLOTS = [
+    plot_change_summary, plot_write_comparison, plot_mixed_comparison,
+    plot_delete_comparison, plot_seek_comparison, plot_range_comparison,
+    plot_batch_comparison, plot_value_size_comparison, plot_latency_comparison,
+    plot_latency_percentiles_comparison, plot_write_amp_comparison,
+    plot_resource_comparison,
+]
+
+_worker_args = None
+
+
+def _init_worker(args, dpi, input_key):
+    # Spawned workers re-import this module, so carry over what main() set
+    global _worker_args, DPI, _INPUT_KEY
+    _worker_args, DPI, _INPUT_KEY = args, dpi, input_key
+    setup_style()
+
+
+def _run_plot(fn):
+    fn(*_worker_args)
+    flush_writes()  # pool workers exit without running atexit hooks
+    gc.collect()  # cleared cached figures leave cyclic artist garbage
+
+
+def render_all(df_new, df_old, new_label, old_label):
+    """Render every plot, fanning out across worker processes when cores allow."""
+    global _INPUT_KEY
+    args = (df_new, df_old, new_label, old_label)
+    _INPUT_KEY = input_key([df_new, df_old], new_label, old_label, DPI)
+    workers = min(len(PLOTS), os.cpu_count() or 1)
+    # Park the loaded data and modules outside the collector: the per-plot
+    # collections stay cheap and forked workers don't copy-on-write them.
+    gc.collect()
+    gc.freeze()
+    if workers > 1:
+        sys.stdout.flush()  # don't let children replay the parent's buffered output
+        # fork shares the loaded data for free; spawn (macOS/Windows) pickles it
+        # once per worker, which is cheap for the grouped tables
+        method = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn'
+        pool = multiprocessing.get_context(method).Pool(
+            workers, initializer=_init_worker, initargs=(args, DPI, _INPUT_KEY))
+        try:
+            pool.map(_run_plot, PLOTS, chunksize=1)
+        finally:
+            pool.close()  # not terminate(): workers must exit cleanly to flush stdout
+            pool.join()
+    else:
+        for fn in PLOTS:
+            fn(*args)
+            gc.collect()
+    flush_writes()
+    plt.close('all')
+
+
+def positive_int(text):
+    """argparse type for --dpi: a whole number above zero."""
+    try:
+        n = int(text)
+    except ValueError:
+        n = 0
+    if n <= 0:
+        raise argparse.ArgumentTypeError(f'expected a positive integer, got {text!r}')
+    return n
+
+
+def parse_args(argv):
+    """Set DPI from --dpi N / --dpi=N and return the positional CSV paths."""
+    global DPI
+    parser = argparse.ArgumentParser(usage='python compare_tidesdb_versions.py <newer_csv> <older_csv> [--dpi N]')
+    parser.add_argument('csv', nargs='*', help=argparse.SUPPRESS)
+    parser.add_argument('--dpi', type=positive_int, default=DPI, metavar='N',
+                        help=f'PNG resolution (default {DPI})')
+    ns = parser.parse_args(argv)
+    DPI = ns.dpi
+    return ns.csv
+
+
 def main():
-    if len(sys.argv) < 3:
-        print("Usage: python compare_tidesdb_versions.py <newer_csv> <older_csv>")
+    args = parse_args(sys.argv[1:])
+    if len(args) < 2:
+        print("Usage: python compare_tidesdb_versions.py <newer_csv> <older_csv> [--dpi N]")
         print("\nExample:")
         print("  python compare_tidesdb_versions.py \\")
         print("    tidesdb_rocksdb_benchmark_results_20260217_113922.csv \\")
         print("    tidesdb_rocksdb_benchmark_results_20260216_061038.csv")
         sys.exit(1)
     
-    new_csv = sys.argv[1]
-    old_csv = sys.argv[2]
+    new_csv = args[0]
+    old_csv = args[1]
     
     if not os.path.exists(new_csv):
         print(f"Error: File not found: {new_csv}")
@@ -707,8 +953,8 @@ def main():
     df_new = load_data(new_csv)
     df_old = load_data(old_csv)
     
-    print(f"  Newer version: {len(df_new)} TidesDB benchmark entries")
-    print(f"  Older version: {len(df_old)} TidesDB benchmark entries")
+    print(f"  Newer version: {df_new.attrs['rows']} TidesDB benchmark entries")
+    print(f"  Older version: {df_old.attrs['rows']} TidesDB benchmark entries")
     
     # Create output directory
     os.makedirs(OUT_DIR, exist_ok=True)
@@ -719,18 +965,7 @@ def main():
     # Generate plots
     print(f"\nGenerating comparison plots in '{OUT_DIR}/'...")
     
-    plot_change_summary(df_new, df_old, new_label, old_label)
-    plot_write_comparison(df_new, df_old, new_label, old_label)
-    plot_mixed_comparison(df_new, df_old, new_label, old_label)
-    plot_delete_comparison(df_new, df_old, new_label, old_label)
-    plot_seek_comparison(df_new, df_old, new_label, old_label)
-    plot_range_comparison(df_new, df_old, new_label, old_label)
-    plot_batch_comparison(df_new, df_old, new_label, old_label)
-    plot_value_size_comparison(df_new, df_old, new_label, old_label)
-    plot_latency_comparison(df_new, df_old, new_label, old_label)
-    plot_latency_percentiles_comparison(df_new, df_old, new_label, old_label)
-    plot_write_amp_comparison(df_new, df_old, new_label, old_label)
-    plot_resource_comparison(df_new, df_old, new_label, old_label)
+    render_all(df_new, df_old, new_label, old_label)
     
     # Generate text report
     print("\nGenerating text report...")
@@ -11,10 +11,24 @@ import pandas as pd
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+from matplotlib import font_manager
 import numpy as np
 import sys
+import argparse
 import os
 import glob
+import gc
+import io
+import hashlib
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'  # multithreaded parser
+except ImportError:
+    CSV_ENGINE = 'c'
 
 # ── Colors ──
 TIDES = '#1565C0'
@@ -22,24 +36,93 @@ ROCKS = '#9E9E9E'
 TIDES_L = '#64B5F6'
 ROCKS_L = '#E0E0E0'
 OUT_DIR = 'benchmark_plots'
+_FIG_CACHE = {}  # figsize -> Figure, reused across plots
+_WRITER = None  # background PNG file writer, created on first save
+_PENDING = []
+_INPUT_KEY = b''  # digest of the plotted data and this script; see input_key()
+DPI = 200  # PNG resolution; override with --dpi=N
+CHUNKED_READ_BYTES = 200_000_000  # stream CSVs larger than this
+CHUNK_ROWS = 200_000
+
+# Metric columns pivoted per engine by load_data
+METRICS = ['ops_per_sec', 'duration_sec', 'avg_latency_us', 'cv_percent',
+           'p50_us', 'p95_us', 'p99_us', 'peak_rss_mb', 'peak_vms_mb',
+           'disk_write_mb', 'cpu_percent', 'db_size_mb', 'write_amp', 'space_amp']
+
+
+@lru_cache(maxsize=None)
+def sans_font():
+    """Concrete sans-serif family name, so text skips the fallback-list search."""
+    path = font_manager.findfont(font_manager.FontProperties(family=['sans-serif']))
+    return font_manager.FontProperties(fname=path).get_name()
 
 
 def setup_style():
     plt.rcParams.update({
         'figure.facecolor': 'white', 'axes.facecolor': '#FAFAFA',
         'axes.grid': True, 'grid.alpha': 0.25, 'grid.linestyle': '--',
-        'font.family': 'sans-serif', 'font.size': 10,
+        'font.family': sans_font(), 'font.size': 10,
         'axes.titlesize': 13, 'axes.titleweight': 'bold', 'axes.labelsize': 11,
         'figure.titlesize': 15, 'figure.titleweight': 'bold',
         'legend.fontsize': 10, 'xtick.labelsize': 9, 'ytick.labelsize': 9,
+        'savefig.dpi': DPI,
+        # Fewer path segments per draw; cached figures stay open on purpose
+        'path.simplify': True, 'path.simplify_threshold': 1.0,
+        'agg.path.chunksize': 10000, 'figure.max_open_warning': 0,
+        # Unhinted glyphs rasterize faster and are indistinguishable at this DPI
+        'text.hinting': 'none', 'text.antialiased': True,
     })
+    warm_fonts()
+
+
+@lru_cache(maxsize=None)
+def warm_fonts():
+    """Load the regular and bold faces once, before any worker forks."""
+    fig = plt.figure(figsize=(1, 1))
+    fig.text(0, 0, '0123456789.%+-x KMGB ops/s')
+    fig.text(0, .5, '0123456789.%+-x KMGB ops/s', weight='bold')
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+def main_rows(df):
+    """Drop populate phases and ITER rows with one combined mask."""
+    # Match the distinct test names once, then broadcast by code (-1 = NaN -> False).
+    # astype(str): pyarrow types the categories of a header-only file as float
+    names = df['test_name'].cat
+    hit = np.asarray(names.categories.astype(str).str.contains('_populate'), dtype=bool)
+    populate = np.append(hit, False)[names.codes.to_numpy()]
+    keep = (~populate
+            & (df['operation'] != 'ITER').to_numpy(dtype=bool))
+    return df[keep]
+
+
+def used_columns(csv_path):
+    """Header columns the plots read; everything else is never parsed."""
+    header = pd.read_csv(csv_path, nrows=0).columns
+    return [c for c in header if c in ('engine', 'test_name', 'operation') or c in METRICS]
 
 
 def load_data(csv_path):
-    df = pd.read_csv(csv_path)
-    main = df[~df['test_name'].str.contains('_populate', na=False)]
-    main = main[main['operation'] != 'ITER'].copy()
-    return main
+    """Load results as one row per (test_name, operation) with (metric, engine) columns."""
+    usecols = used_columns(csv_path)
+    # Metrics only feed chart labels, so float32 halves them at no visible cost
+    dtype = {c: 'float32' for c in usecols if c in METRICS}
+    dtype.update({'test_name': 'category', 'engine': 'category', 'operation': 'category'})
+    keys = ['test_name', 'operation', 'engine']
+    if os.path.getsize(csv_path) > CHUNKED_READ_BYTES:
+        # Reduce each chunk to its first row per group as it streams in, so
+        # memory tracks the number of tests rather than the length of the log
+        chunks = pd.read_csv(csv_path, chunksize=CHUNK_ROWS, usecols=usecols, dtype=dtype)
+        parts = [main_rows(c).drop_duplicates(keys) for c in chunks]
+        main = pd.concat(parts, ignore_index=True).astype(dtype)
+    else:
+        main = main_rows(pd.read_csv(csv_path, engine=CSV_ENGINE, usecols=usecols, dtype=dtype))
+    # Single wide (metric, engine) table so plots pull whole per-engine columns.
+    # Each cell comes from the first row of its test, NaNs included, and
+    # drop_duplicates+unstack skips pivot_table's margin/dropna machinery
+    metrics = [c for c in METRICS if c in main.columns]
+    return main.drop_duplicates(keys).set_index(keys)[metrics].unstack('engine')
 
 
 def has_data(df, tests):
@@ -54,27 +137,39 @@ def has_data(df, tests):
     return False
 
 
-def filter_available(df, tests, op_idx=1):
-    """Filter tests to only those with data available."""
-    available = []
-    for item in tests:
-        tn = item[0]
-        op = item[op_idx] if len(item) > op_idx else 'PUT'
-        t = val(df, 'tidesdb', tn, op, 'ops_per_sec')
-        r = val(df, 'rocksdb', tn, op, 'ops_per_sec')
-        if t > 0 or r > 0:
-            available.append(item)
-    return available
+def filter_available(df, tests, column='ops_per_sec', op=None):
+    """Filter tests to those where either engine has data in column."""
+    keys = [(t[0], op or t[1]) for t in tests]
+    tv, rv = engine_vals(df, keys, column)
+    has = (tv > 0) | (rv > 0)
+    return [t for t, keep in zip(tests, has) if keep]
 
 
 def val(df, engine, test_name, operation, column):
-    row = df[(df['engine'] == engine) & (df['test_name'] == test_name) & (df['operation'] == operation)]
-    if row.empty:
+    try:
+        v = df.at[(test_name, operation), (column, engine)]
+    except KeyError:
         return 0
-    v = row.iloc[0][column]
     return 0 if pd.isna(v) else float(v)
 
 
+def vals(df, engine, keys, column):
+    """Vectorized val() over a list of (test_name, operation) keys."""
+    if not keys or (column, engine) not in df.columns:
+        return np.zeros(len(keys))
+    return df[(column, engine)].reindex(keys).fillna(0).to_numpy(dtype=float)
+
+
+def engine_vals(df, keys, column):
+    """(tidesdb, rocksdb) vals() pair from a single reindex of the metric's columns."""
+    if not keys or column not in df.columns.get_level_values(0):
+        return np.zeros(len(keys)), np.zeros(len(keys))
+    pair = (df[column].reindex(index=keys, columns=['tidesdb', 'rocksdb'])
+            .fillna(0).to_numpy(dtype=float))
+    return pair[:, 0], pair[:, 1]
+
+
+@lru_cache(maxsize=1024)
 def fmt_v(v):
     if v >= 1_000_000:
         return f'{v/1e6:.2f}M'
@@ -85,7 +180,20 @@ def fmt_v(v):
     return f'{v:.2f}'
 
 
-def paired_bars(ax, labels, tv, rv, ylabel, title, decimal=False, rotation=25):
+def fmt_vs(values, decimal=False):
+    """Vectorized fmt_v() for bar labels; non-positive values get no label."""
+    v = np.asarray(values, dtype=float)
+    if decimal:
+        text = np.char.mod('%.2f', v)
+    else:
+        text = np.select([v >= 1e6, v >= 1e3, v >= 10],
+                         [np.char.mod('%.2fM', v / 1e6), np.char.mod('%.1fK', v / 1e3),
+                          np.char.mod('%.0f', v)],
+                         np.char.mod('%.2f', v))
+    return np.where(v > 0, text, '')
+
+
+def paired_bars(ax, labels, tv, rv, ylabel, title, decimal=False, rotation=25, legend=True):
     x = np.arange(len(labels))
     w = 0.35
     b1 = ax.bar(x - w/2, tv, w, label='TidesDB', color=TIDES, edgecolor='white', lw=.5, zorder=3)
@@ -94,24 +202,80 @@ def paired_bars(ax, labels, tv, rv, ylabel, title, decimal=False, rotation=25):
     ax.set_title(title)
     ax.set_xticks(x)
     ax.set_xticklabels(labels, rotation=rotation, ha='right')
-    ax.legend(loc='best')
+    if legend:
+        ax.legend(loc='best')
     ax.set_axisbelow(True)
     for bars, c in [(b1, TIDES), (b2, '#616161')]:
-        for bar in bars:
-            h = bar.get_height()
-            if h > 0:
-                txt = f'{h:.2f}' if decimal else fmt_v(h)
-                ax.annotate(txt, xy=(bar.get_x() + bar.get_width()/2, h),
-                            xytext=(0, 4), textcoords='offset points',
-                            ha='center', va='bottom', fontsize=7, color=c, fontweight='bold')
+        ax.bar_label(bars, labels=fmt_vs(bars.datavalues, decimal), padding=4, fontsize=7, color=c, fontweight='bold')
+
+
+def get_fig(figsize, nrows=1, ncols=1):
+    """Reuse one figure per size instead of building a new one for every plot."""
+    fig = _FIG_CACHE.get(figsize)
+    if fig is None:
+        fig = _FIG_CACHE[figsize] = plt.figure(figsize=figsize)
+    else:
+        fig.clear()
+    return fig, fig.subplots(nrows, ncols)
+
+
+def shared_legend(fig, ax):
+    """One legend under the suptitle for grids; returns the top for tight_layout."""
+    h = fig.get_figheight()
+    fig.legend(*ax.get_legend_handles_labels(), loc='upper center', ncol=2,
+               bbox_to_anchor=(0.5, .98 - .3/h))
+    return .98 - .5/h
 
 
 def save(fig, name):
-    fig.savefig(f'{OUT_DIR}/{name}', dpi=200, bbox_inches='tight')
-    plt.close(fig)
+    global _WRITER
+    # Fast zlib level: the PNG deflate dominated save time, files grow modestly.
+    # No bbox_inches='tight': every plot already ran tight_layout, and the
+    # tight bbox would cost an extra draw pass per save.
+    # The encoded bytes go to disk on a writer thread so file I/O overlaps the next plot.
+    # A sidecar hash of the inputs lets reruns on the same data skip the render.
+    path, tag = f'{OUT_DIR}/{name}', f'{OUT_DIR}/.{name}.hash'
+    key = hashlib.blake2b(_INPUT_KEY + name.encode(), digest_size=8).hexdigest()
+    if os.path.exists(path) and os.path.exists(tag):
+        with open(tag) as f:
+            if f.read() == key:
+                print(f'  = {name} (unchanged)')
+                return
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', pil_kwargs={'compress_level': 1})
+    if _WRITER is None:
+        _WRITER = ThreadPoolExecutor(max_workers=1)
+    _PENDING.append(_WRITER.submit(write_file, path, buf.getvalue(), tag, key))
     print(f'  + {name}')
 
 
+def write_file(path, data, tag, key):
+    with open(path, 'wb') as f:
+        f.write(data)
+    with open(tag, 'w') as f:  # only after the PNG is complete
+        f.write(key)
+
+
+def input_key(frames, *extra):
+    """Digest of the data, labels, this script and matplotlib version."""
+    h = hashlib.blake2b(digest_size=16)
+    for df in frames:
+        h.update(str(list(df.columns)).encode())
+        h.update(pd.util.hash_pandas_object(df).to_numpy().tobytes())
+    for x in extra:
+        h.update(str(x).encode())
+    with open(__file__, 'rb') as f:
+        h.update(f.read())
+    h.update(matplotlib.__version__.encode())
+    return h.digest()
+
+
+def flush_writes():
+    """Wait for queued PNG writes, re-raising any I/O error."""
+    while _PENDING:
+        _PENDING.pop(0).result()
+
+
 # ═══════════════════════════════════════════════
 # Plot 00: Speedup Summary
 # ═══════════════════════════════════════════════
@@ -141,17 +305,15 @@ def plot_speedup_summary(df):
         ('sync_write_random_100K_t8_b1000', 'PUT', 'Sync Write (100K, 8t)'),
         ('sync_write_random_500K_t16_b1000', 'PUT', 'Sync Write (500K, 16t)'),
     ]
-    labels, ratios = [], []
-    for tn, op, lbl in tests:
-        t = val(df, 'tidesdb', tn, op, 'ops_per_sec')
-        r = val(df, 'rocksdb', tn, op, 'ops_per_sec')
-        if t > 0 and r > 0:
-            labels.append(lbl)
-            ratios.append(t / r)
-    fig, ax = plt.subplots(figsize=(14, 10))
+    keys = [t[:2] for t in tests]
+    tv, rv = engine_vals(df, keys, 'ops_per_sec')
+    both = (tv > 0) & (rv > 0)
+    ratios = tv[both] / rv[both]
+    labels = [t[2] for t, keep in zip(tests, both) if keep]
+    fig, ax = get_fig((14, 10))
     fig.suptitle('TidesDB Speedup over RocksDB (Throughput Ratio)')
     y = np.arange(len(labels))
-    colors = [TIDES if r >= 1.0 else '#EF5350' for r in ratios]
+    colors = np.where(ratios >= 1.0, TIDES, '#EF5350')
     bars = ax.barh(y, ratios, color=colors, edgecolor='white', lw=.5, height=.7, zorder=3)
     ax.axvline(x=1.0, color='#424242', ls='--', lw=1.5, zorder=2)
     ax.set_yticks(y)
@@ -159,14 +321,17 @@ def plot_speedup_summary(df):
     ax.set_xlabel('Speedup Factor (TidesDB / RocksDB)')
     ax.invert_yaxis()
     ax.set_axisbelow(True)
-    for bar, ratio in zip(bars, ratios):
-        ax.text(bar.get_width() + 0.05, bar.get_y() + bar.get_height()/2,
-                f'{ratio:.2f}x', va='center', fontsize=9, fontweight='bold',
-                color=TIDES if ratio >= 1.0 else '#C62828')
+    text = np.char.mod('%.2fx', ratios)
+    faster = ratios >= 1.0
+    for mask, c in [(faster, TIDES), (~faster, '#C62828')]:
+        ax.bar_label(bars, labels=np.where(mask, text, ''), padding=5,
+                     fontsize=9, fontweight='bold', color=c)
+    ax.margins(x=.08)  # room for the labels past the longest bars
     ax.text(0.98, 0.02, '> 1.0 = TidesDB faster | < 1.0 = RocksDB faster',
             transform=ax.transAxes, ha='right', va='bottom', fontsize=9,
             style='italic', color='#757575',
             bbox=dict(boxstyle='round,pad=0.3', fc='white', ec='#E0E0E0'))
+    fig.tight_layout()
     save(fig, '00_speedup_summary.png')
 
 
@@ -181,8 +346,8 @@ def plot_write_throughput(df):
                    ('write_random_40M_t16_b1000','Random\n40M'),
                    ('write_zipfian_20M_t16_b1000','Zipfian\n20M')]
     
-    std_avail = [(t[0], t[1]) for t in std_tests if val(df,'tidesdb',t[0],'PUT','ops_per_sec') > 0 or val(df,'rocksdb',t[0],'PUT','ops_per_sec') > 0]
-    large_avail = [(t[0], t[1]) for t in large_tests if val(df,'tidesdb',t[0],'PUT','ops_per_sec') > 0 or val(df,'rocksdb',t[0],'PUT','ops_per_sec') > 0]
+    std_avail = filter_available(df, std_tests, op='PUT')
+    large_avail = filter_available(df, large_tests, op='PUT')
     
     if not std_avail and not large_avail:
         print('  - 01_write_throughput.png (no data, skipped)')
@@ -190,20 +355,20 @@ def plot_write_throughput(df):
     
     # Determine layout based on available data
     if std_avail and large_avail:
-        fig, (a1, a2) = plt.subplots(1, 2, figsize=(16, 6))
+        fig, (a1, a2) = get_fig((16, 6), 1, 2)
         axes = [(a1, std_avail, 'Standard (8 threads)'), (a2, large_avail, 'Large Scale (16 threads)')]
     elif std_avail:
-        fig, a1 = plt.subplots(1, 1, figsize=(10, 6))
+        fig, a1 = get_fig((10, 6))
         axes = [(a1, std_avail, 'Standard (8 threads)')]
     else:
-        fig, a1 = plt.subplots(1, 1, figsize=(10, 6))
+        fig, a1 = get_fig((10, 6))
         axes = [(a1, large_avail, 'Large Scale (16 threads)')]
     
     fig.suptitle('Write Throughput (ops/sec)')
     for ax, tests, title in axes:
         lbl = [t[1] for t in tests]
-        tv = [val(df,'tidesdb',t[0],'PUT','ops_per_sec') for t in tests]
-        rv = [val(df,'rocksdb',t[0],'PUT','ops_per_sec') for t in tests]
+        keys = [(t[0], 'PUT') for t in tests]
+        tv, rv = engine_vals(df, keys, 'ops_per_sec')
         paired_bars(ax, lbl, tv, rv, 'ops/sec', title)
     fig.tight_layout(rect=[0,0,1,.93])
     save(fig, '01_write_throughput.png')
@@ -222,9 +387,9 @@ def plot_read_mixed(df):
                  ('mixed_zipfian_5M_t8_b1000','GET','Zipf\n5M,8t'),
                  ('mixed_random_20M_t16_b1000','GET','Rand\n20M,16t')]
     
-    read_avail = [t for t in read_tests if val(df,'tidesdb',t[0],t[1],'ops_per_sec') > 0 or val(df,'rocksdb',t[0],t[1],'ops_per_sec') > 0]
-    put_avail = [t for t in mixed_put if val(df,'tidesdb',t[0],t[1],'ops_per_sec') > 0 or val(df,'rocksdb',t[0],t[1],'ops_per_sec') > 0]
-    get_avail = [t for t in mixed_get if val(df,'tidesdb',t[0],t[1],'ops_per_sec') > 0 or val(df,'rocksdb',t[0],t[1],'ops_per_sec') > 0]
+    read_avail = filter_available(df, read_tests)
+    put_avail = filter_available(df, mixed_put)
+    get_avail = filter_available(df, mixed_get)
     
     panels = []
     if read_avail:
@@ -238,15 +403,15 @@ def plot_read_mixed(df):
         print('  - 02_read_mixed_throughput.png (no data, skipped)')
         return
     
-    fig, axes = plt.subplots(1, len(panels), figsize=(6*len(panels), 6))
+    fig, axes = get_fig((6*len(panels), 6), 1, len(panels))
     if len(panels) == 1:
         axes = [axes]
     fig.suptitle('Read & Mixed Workload Throughput')
     
     for ax, (tests, title) in zip(axes, panels):
+        keys = [x[:2] for x in tests]
         paired_bars(ax, [x[2] for x in tests],
-                    [val(df,'tidesdb',x[0],x[1],'ops_per_sec') for x in tests],
-                    [val(df,'rocksdb',x[0],x[1],'ops_per_sec') for x in tests],
+                    *engine_vals(df, keys, 'ops_per_sec'),
                     'ops/sec', title)
     fig.tight_layout(rect=[0,0,1,.93])
     save(fig, '02_read_mixed_throughput.png')
@@ -264,8 +429,8 @@ def plot_delete(df):
                    ('delete_batch_1000_20M_t16','Batch 1000'),
                    ('delete_random_20M_t16_b1000','Main b1000')]
     
-    std_avail = [t for t in std_tests if val(df,'tidesdb',t[0],'DELETE','ops_per_sec') > 0 or val(df,'rocksdb',t[0],'DELETE','ops_per_sec') > 0]
-    large_avail = [t for t in large_tests if val(df,'tidesdb',t[0],'DELETE','ops_per_sec') > 0 or val(df,'rocksdb',t[0],'DELETE','ops_per_sec') > 0]
+    std_avail = filter_available(df, std_tests, op='DELETE')
+    large_avail = filter_available(df, large_tests, op='DELETE')
     
     if not std_avail and not large_avail:
         print('  - 03_delete_throughput.png (no data, skipped)')
@@ -277,15 +442,15 @@ def plot_delete(df):
     if large_avail:
         panels.append((large_avail, 'Large Scale (16 threads)'))
     
-    fig, axes = plt.subplots(1, len(panels), figsize=(8*len(panels), 6))
+    fig, axes = get_fig((8*len(panels), 6), 1, len(panels))
     if len(panels) == 1:
         axes = [axes]
     fig.suptitle('Delete Throughput')
     
     for ax, (tests, title) in zip(axes, panels):
         lbl = [t[1] for t in tests]
-        tv = [val(df,'tidesdb',t[0],'DELETE','ops_per_sec') for t in tests]
-        rv = [val(df,'rocksdb',t[0],'DELETE','ops_per_sec') for t in tests]
+        keys = [(t[0], 'DELETE') for t in tests]
+        tv, rv = engine_vals(df, keys, 'ops_per_sec')
         paired_bars(ax, lbl, tv, rv, 'ops/sec', title)
     fig.tight_layout(rect=[0,0,1,.93])
     save(fig, '03_delete_throughput.png')
@@ -300,8 +465,8 @@ def plot_seek(df):
     large_tests = [('seek_random_20M_t16','Random'),('seek_seq_20M_t16','Sequential'),
                    ('seek_zipfian_20M_t16','Zipfian')]
     
-    std_avail = [t for t in std_tests if val(df,'tidesdb',t[0],'SEEK','ops_per_sec') > 0 or val(df,'rocksdb',t[0],'SEEK','ops_per_sec') > 0]
-    large_avail = [t for t in large_tests if val(df,'tidesdb',t[0],'SEEK','ops_per_sec') > 0 or val(df,'rocksdb',t[0],'SEEK','ops_per_sec') > 0]
+    std_avail = filter_available(df, std_tests, op='SEEK')
+    large_avail = filter_available(df, large_tests, op='SEEK')
     
     if not std_avail and not large_avail:
         print('  - 04_seek_throughput.png (no data, skipped)')
@@ -313,15 +478,15 @@ def plot_seek(df):
     if large_avail:
         panels.append((large_avail, 'Large Scale (16 threads)'))
     
-    fig, axes = plt.subplots(1, len(panels), figsize=(8*len(panels), 6))
+    fig, axes = get_fig((8*len(panels), 6), 1, len(panels))
     if len(panels) == 1:
         axes = [axes]
     fig.suptitle('Seek Throughput')
     
     for ax, (tests, title) in zip(axes, panels):
         lbl = [t[1] for t in tests]
-        tv = [val(df,'tidesdb',t[0],'SEEK','ops_per_sec') for t in tests]
-        rv = [val(df,'rocksdb',t[0],'SEEK','ops_per_sec') for t in tests]
+        keys = [(t[0], 'SEEK') for t in tests]
+        tv, rv = engine_vals(df, keys, 'ops_per_sec')
         paired_bars(ax, lbl, tv, rv, 'ops/sec', title)
     fig.tight_layout(rect=[0,0,1,.93])
     save(fig, '04_seek_throughput.png')
@@ -338,8 +503,8 @@ def plot_range(df):
                    ('range_random_1000_2M_t16','Rand 1000\n2M'),
                    ('range_seq_100_4M_t16','Seq 100\n4M')]
     
-    std_avail = [t for t in std_tests if val(df,'tidesdb',t[0],'RANGE','ops_per_sec') > 0 or val(df,'rocksdb',t[0],'RANGE','ops_per_sec') > 0]
-    large_avail = [t for t in large_tests if val(df,'tidesdb',t[0],'RANGE','ops_per_sec') > 0 or val(df,'rocksdb',t[0],'RANGE','ops_per_sec') > 0]
+    std_avail = filter_available(df, std_tests, op='RANGE')
+    large_avail = filter_available(df, large_tests, op='RANGE')
     
     if not std_avail and not large_avail:
         print('  - 05_range_scan_throughput.png (no data, skipped)')
@@ -351,15 +516,15 @@ def plot_range(df):
     if large_avail:
         panels.append((large_avail, 'Large Scale (16 threads)'))
     
-    fig, axes = plt.subplots(1, len(panels), figsize=(8*len(panels), 6))
+    fig, axes = get_fig((8*len(panels), 6), 1, len(panels))
     if len(panels) == 1:
         axes = [axes]
     fig.suptitle('Range Scan Throughput')
     
     for ax, (tests, title) in zip(axes, panels):
         lbl = [t[1] for t in tests]
-        tv = [val(df,'tidesdb',t[0],'RANGE','ops_per_sec') for t in tests]
-        rv = [val(df,'rocksdb',t[0],'RANGE','ops_per_sec') for t in tests]
+        keys = [(t[0], 'RANGE') for t in tests]
+        tv, rv = engine_vals(df, keys, 'ops_per_sec')
         paired_bars(ax, lbl, tv, rv, 'ops/sec', title)
     fig.tight_layout(rect=[0,0,1,.93])
     save(fig, '05_range_scan_throughput.png')
@@ -376,10 +541,8 @@ def plot_batch_scaling(df):
     large_names = ['batch_1_40M_t16','batch_100_40M_t16','batch_1000_40M_t16']
     
     # Check which data is available
-    std_avail = [(b, n) for b, n in zip(std_batches, std_names) 
-                 if val(df,'tidesdb',n,'PUT','ops_per_sec') > 0 or val(df,'rocksdb',n,'PUT','ops_per_sec') > 0]
-    large_avail = [(b, n) for b, n in zip(large_batches, large_names)
-                   if val(df,'tidesdb',n,'PUT','ops_per_sec') > 0 or val(df,'rocksdb',n,'PUT','ops_per_sec') > 0]
+    std_avail = [(b, n) for n, b in filter_available(df, list(zip(std_names, std_batches)), op='PUT')]
+    large_avail = [(b, n) for n, b in filter_available(df, list(zip(large_names, large_batches)), op='PUT')]
     
     if not std_avail and not large_avail:
         print('  - 06_batch_size_scaling.png (no data, skipped)')
@@ -391,14 +554,14 @@ def plot_batch_scaling(df):
     if large_avail:
         panels.append(([b for b,n in large_avail], [n for b,n in large_avail], 'Large Scale (40M, 16t)'))
     
-    fig, axes = plt.subplots(1, len(panels), figsize=(8*len(panels), 6))
+    fig, axes = get_fig((8*len(panels), 6), 1, len(panels))
     if len(panels) == 1:
         axes = [axes]
     fig.suptitle('Batch Size Scaling — Write Throughput')
     
     for ax, (batches, names, title) in zip(axes, panels):
-        tv = [val(df,'tidesdb',n,'PUT','ops_per_sec') for n in names]
-        rv = [val(df,'rocksdb',n,'PUT','ops_per_sec') for n in names]
+        keys = [(n, 'PUT') for n in names]
+        tv, rv = engine_vals(df, keys, 'ops_per_sec')
         ax.plot(batches, tv, 'o-', color=TIDES, lw=2.5, ms=8, label='TidesDB', zorder=3)
         ax.plot(batches, rv, 's-', color=ROCKS, lw=2.5, ms=8, label='RocksDB', zorder=3)
         ax.set_xscale('log')
@@ -429,8 +592,8 @@ def plot_value_size(df):
                    ('write_random_40M_t16_b1000','100B val\n40M'),
                    ('write_large_values_4M_k256_v4096_t16_b1000','4KB val\n4M')]
     
-    std_avail = [t for t in std_tests if val(df,'tidesdb',t[0],'PUT','ops_per_sec') > 0 or val(df,'rocksdb',t[0],'PUT','ops_per_sec') > 0]
-    large_avail = [t for t in large_tests if val(df,'tidesdb',t[0],'PUT','ops_per_sec') > 0 or val(df,'rocksdb',t[0],'PUT','ops_per_sec') > 0]
+    std_avail = filter_available(df, std_tests, op='PUT')
+    large_avail = filter_available(df, large_tests, op='PUT')
     
     if not std_avail and not large_avail:
         print('  - 07_value_size_impact.png (no data, skipped)')
@@ -442,15 +605,15 @@ def plot_value_size(df):
     if large_avail:
         panels.append((large_avail, 'Large Scale (16 threads)'))
     
-    fig, axes = plt.subplots(1, len(panels), figsize=(8*len(panels), 6))
+    fig, axes = get_fig((8*len(panels), 6), 1, len(panels))
     if len(panels) == 1:
         axes = [axes]
     fig.suptitle('Value Size Impact on Write Throughput')
     
     for ax, (tests, title) in zip(axes, panels):
         lbl = [t[1] for t in tests]
-        tv = [val(df,'tidesdb',t[0],'PUT','ops_per_sec') for t in tests]
-        rv = [val(df,'rocksdb',t[0],'PUT','ops_per_sec') for t in tests]
+        keys = [(t[0], 'PUT') for t in tests]
+        tv, rv = engine_vals(df, keys, 'ops_per_sec')
         paired_bars(ax, lbl, tv, rv, 'ops/sec', title)
     fig.tight_layout(rect=[0,0,1,.93])
     save(fig, '07_value_size_impact.png')
@@ -489,7 +652,7 @@ def plot_latency_overview(df):
     # Filter panels to only those with data, and filter tests within panels
     panels = []
     for title, tests in all_panels:
-        avail = [t for t in tests if val(df,'tidesdb',t[0],t[1],'avg_latency_us') > 0 or val(df,'rocksdb',t[0],t[1],'avg_latency_us') > 0]
+        avail = filter_available(df, tests, 'avg_latency_us')
         if avail:
             panels.append((title, avail))
     
@@ -500,21 +663,21 @@ def plot_latency_overview(df):
     # Dynamic layout
     n = len(panels)
     if n <= 2:
-        fig, axes = plt.subplots(1, n, figsize=(8*n, 6))
+        fig, axes = get_fig((8*n, 6), 1, n)
         if n == 1:
             axes = [axes]
     else:
         rows = (n + 1) // 2
-        fig, axes = plt.subplots(rows, 2, figsize=(18, 6*rows))
+        fig, axes = get_fig((18, 6*rows), rows, 2)
         axes = axes.flatten()[:n]
     
     fig.suptitle('Average Latency (us) — Lower is Better')
     for ax, (title, tests) in zip(axes, panels):
         lbl = [t[2] for t in tests]
-        tv = [val(df,'tidesdb',t[0],t[1],'avg_latency_us') for t in tests]
-        rv = [val(df,'rocksdb',t[0],t[1],'avg_latency_us') for t in tests]
-        paired_bars(ax, lbl, tv, rv, 'Avg Latency (us)', title)
-    fig.tight_layout(rect=[0,0,1,.95])
+        keys = [t[:2] for t in tests]
+        tv, rv = engine_vals(df, keys, 'avg_latency_us')
+        paired_bars(ax, lbl, tv, rv, 'Avg Latency (us)', title, legend=False)
+    fig.tight_layout(rect=[0,0,1,shared_legend(fig, axes[0])])
     save(fig, '08_latency_overview.png')
 
 
@@ -532,7 +695,7 @@ def plot_latency_percentiles(df):
     ]
     
     # Filter to available workloads
-    wklds = [w for w in all_wklds if val(df,'tidesdb',w[0],w[1],'p50_us') > 0 or val(df,'rocksdb',w[0],w[1],'p50_us') > 0]
+    wklds = filter_available(df, all_wklds, 'p50_us')
     
     if not wklds:
         print('  - 09_latency_percentiles.png (no data, skipped)')
@@ -541,23 +704,26 @@ def plot_latency_percentiles(df):
     # Dynamic layout
     n = len(wklds)
     if n <= 3:
-        fig, axes = plt.subplots(1, n, figsize=(6*n, 6))
+        fig, axes = get_fig((6*n, 6), 1, n)
         if n == 1:
             axes = [axes]
         else:
             axes = list(axes)
     else:
         rows = (n + 2) // 3
-        fig, axes = plt.subplots(rows, 3, figsize=(20, 6*rows))
+        fig, axes = get_fig((20, 6*rows), rows, 3)
         axes = axes.flatten()[:n]
     
     fig.suptitle('Latency Percentiles (us) — p50 / p95 / p99')
-    for ax, (tn, op, title) in zip(axes, wklds):
-        pcts = ['p50_us','p95_us','p99_us']
-        tv = [val(df,'tidesdb',tn,op,p) for p in pcts]
-        rv = [val(df,'rocksdb',tn,op,p) for p in pcts]
-        paired_bars(ax, ['p50','p95','p99'], tv, rv, 'Latency (us)', title, rotation=0)
-    fig.tight_layout(rect=[0,0,1,.95])
+    # One (workload x percentile) block per engine instead of a lookup per bar
+    keys = [w[:2] for w in wklds]
+    pcts = ['p50_us','p95_us','p99_us']
+    sub = df.reindex(keys)
+    t_pct = np.column_stack([vals(sub, 'tidesdb', keys, p) for p in pcts])
+    r_pct = np.column_stack([vals(sub, 'rocksdb', keys, p) for p in pcts])
+    for ax, (_, _, title), tv, rv in zip(axes, wklds, t_pct, r_pct):
+        paired_bars(ax, ['p50','p95','p99'], tv, rv, 'Latency (us)', title, rotation=0, legend=False)
+    fig.tight_layout(rect=[0,0,1,shared_legend(fig, axes[0])])
     save(fig, '09_latency_percentiles.png')
 
 
@@ -576,8 +742,8 @@ def plot_write_amp(df):
                    ('write_small_values_200M_k16_v64_t16_b1000','PUT','Small\n200M'),
                    ('write_large_values_4M_k256_v4096_t16_b1000','PUT','Large\n4M')]
     
-    std_avail = [t for t in std_tests if val(df,'tidesdb',t[0],t[1],'write_amp') > 0 or val(df,'rocksdb',t[0],t[1],'write_amp') > 0]
-    large_avail = [t for t in large_tests if val(df,'tidesdb',t[0],t[1],'write_amp') > 0 or val(df,'rocksdb',t[0],t[1],'write_amp') > 0]
+    std_avail = filter_available(df, std_tests, 'write_amp')
+    large_avail = filter_available(df, large_tests, 'write_amp')
     
     if not std_avail and not large_avail:
         print('  - 10_write_amplification.png (no data, skipped)')
@@ -589,15 +755,15 @@ def plot_write_amp(df):
     if large_avail:
         panels.append((large_avail, 'Large Scale'))
     
-    fig, axes = plt.subplots(1, len(panels), figsize=(9*len(panels), 6))
+    fig, axes = get_fig((9*len(panels), 6), 1, len(panels))
     if len(panels) == 1:
         axes = [axes]
     fig.suptitle('Write Amplification — Lower is Better')
     
     for ax, (tests, title) in zip(axes, panels):
         lbl = [t[2] for t in tests]
-        tv = [val(df,'tidesdb',t[0],t[1],'write_amp') for t in tests]
-        rv = [val(df,'rocksdb',t[0],t[1],'write_amp') for t in tests]
+        keys = [t[:2] for t in tests]
+        tv, rv = engine_vals(df, keys, 'write_amp')
         paired_bars(ax, lbl, tv, rv, 'Write Amplification', title, decimal=True)
     fig.tight_layout(rect=[0,0,1,.93])
     save(fig, '10_write_amplification.png')
@@ -616,23 +782,23 @@ def plot_space(df):
         ('write_random_40M_t16_b1000','PUT','Rand 40M'),
     ]
     
-    tests = [t for t in all_tests if val(df,'tidesdb',t[0],t[1],'db_size_mb') > 0 or val(df,'rocksdb',t[0],t[1],'db_size_mb') > 0]
+    tests = filter_available(df, all_tests, 'db_size_mb')
     
     if not tests:
         print('  - 11_space_efficiency.png (no data, skipped)')
         return
     
-    fig, (a1, a2) = plt.subplots(1, 2, figsize=(18, 6))
+    fig, (a1, a2) = get_fig((18, 6), 1, 2)
     fig.suptitle('Space Efficiency — DB Size & Amplification')
     
     lbl = [t[2] for t in tests]
+    keys = [t[:2] for t in tests]
+    sub = df.reindex(keys)  # one row selection shared by every panel
     paired_bars(a1, lbl,
-                [val(df,'tidesdb',t[0],t[1],'db_size_mb') for t in tests],
-                [val(df,'rocksdb',t[0],t[1],'db_size_mb') for t in tests],
+                *engine_vals(sub, keys, 'db_size_mb'),
                 'DB Size (MB)', 'On-Disk Database Size')
     paired_bars(a2, lbl,
-                [val(df,'tidesdb',t[0],t[1],'space_amp') for t in tests],
-                [val(df,'rocksdb',t[0],t[1],'space_amp') for t in tests],
+                *engine_vals(sub, keys, 'space_amp'),
                 'Space Amplification', 'Space Amplification (lower = better)', decimal=True)
     fig.tight_layout(rect=[0,0,1,.93])
     save(fig, '11_space_efficiency.png')
@@ -651,25 +817,26 @@ def plot_resources(df):
         ('read_random_40M_t16','GET','Read 40M'),
     ]
     
-    tests = [t for t in all_tests if val(df,'tidesdb',t[0],t[1],'peak_rss_mb') > 0 or val(df,'rocksdb',t[0],t[1],'peak_rss_mb') > 0]
+    tests = filter_available(df, all_tests, 'peak_rss_mb')
     
     if not tests:
         print('  - 12_resource_usage.png (no data, skipped)')
         return
     
-    fig, axes = plt.subplots(2, 2, figsize=(18, 12))
+    fig, axes = get_fig((18, 12), 2, 2)
     fig.suptitle('Resource Usage Comparison')
     lbl = [t[2] for t in tests]
+    keys = [t[:2] for t in tests]
+    sub = df.reindex(keys)  # one row selection shared by every panel
     for ax, col, ylabel, title in [
         (axes[0,0], 'peak_rss_mb', 'Peak RSS (MB)', 'Memory Usage (Peak RSS)'),
         (axes[0,1], 'disk_write_mb', 'Disk Write (MB)', 'Disk Write Volume'),
         (axes[1,0], 'cpu_percent', 'CPU %', 'CPU Utilization'),
         (axes[1,1], 'peak_vms_mb', 'Peak VMS (MB)', 'Virtual Memory (Peak VMS)'),
     ]:
-        tv = [val(df,'tidesdb',t[0],t[1],col) for t in tests]
-        rv = [val(df,'rocksdb',t[0],t[1],col) for t in tests]
-        paired_bars(ax, lbl, tv, rv, ylabel, title)
-    fig.tight_layout(rect=[0,0,1,.95])
+        tv, rv = engine_vals(sub, keys, col)
+        paired_bars(ax, lbl, tv, rv, ylabel, title, legend=False)
+    fig.tight_layout(rect=[0,0,1,shared_legend(fig, axes[0,0])])
     save(fig, '12_resource_usage.png')
 
 
@@ -686,8 +853,8 @@ def plot_tail_latency(df):
                    ('write_zipfian_20M_t16_b1000','PUT','Zipfian'),
                    ('write_large_values_4M_k256_v4096_t16_b1000','PUT','LargeVal')]
     
-    std_avail = [t for t in std_tests if val(df,'tidesdb',t[0],t[1],'avg_latency_us') > 0 or val(df,'rocksdb',t[0],t[1],'avg_latency_us') > 0]
-    large_avail = [t for t in large_tests if val(df,'tidesdb',t[0],t[1],'avg_latency_us') > 0 or val(df,'rocksdb',t[0],t[1],'avg_latency_us') > 0]
+    std_avail = filter_available(df, std_tests, 'avg_latency_us')
+    large_avail = filter_available(df, large_tests, 'avg_latency_us')
     
     if not std_avail and not large_avail:
         print('  - 13_tail_latency.png (no data, skipped)')
@@ -699,7 +866,7 @@ def plot_tail_latency(df):
     if large_avail:
         panels.append((large_avail, 'Large Scale'))
     
-    fig, axes = plt.subplots(1, len(panels), figsize=(9*len(panels), 6))
+    fig, axes = get_fig((9*len(panels), 6), 1, len(panels))
     if len(panels) == 1:
         axes = [axes]
     fig.suptitle('Tail Latency: Average vs p99 (us)')
@@ -708,10 +875,10 @@ def plot_tail_latency(df):
         x = np.arange(len(tests))
         w = 0.18
         lbl = [t[2] for t in tests]
-        t_avg = [val(df,'tidesdb',t[0],t[1],'avg_latency_us') for t in tests]
-        t_p99 = [val(df,'tidesdb',t[0],t[1],'p99_us') for t in tests]
-        r_avg = [val(df,'rocksdb',t[0],t[1],'avg_latency_us') for t in tests]
-        r_p99 = [val(df,'rocksdb',t[0],t[1],'p99_us') for t in tests]
+        keys = [t[:2] for t in tests]
+        sub = df.reindex(keys)  # one row selection for all four series
+        t_avg, r_avg = engine_vals(sub, keys, 'avg_latency_us')
+        t_p99, r_p99 = engine_vals(sub, keys, 'p99_us')
         ax.bar(x-1.5*w, t_avg, w, label='TidesDB avg', color=TIDES, zorder=3)
         ax.bar(x-0.5*w, t_p99, w, label='TidesDB p99', color=TIDES_L, zorder=3)
         ax.bar(x+0.5*w, r_avg, w, label='RocksDB avg', color=ROCKS, zorder=3)
@@ -741,8 +908,8 @@ def plot_duration(df):
                    ('write_small_values_200M_k16_v64_t16_b1000','PUT','Small\n200M'),
                    ('write_large_values_4M_k256_v4096_t16_b1000','PUT','Large\n4M')]
     
-    std_avail = [t for t in std_tests if val(df,'tidesdb',t[0],t[1],'duration_sec') > 0 or val(df,'rocksdb',t[0],t[1],'duration_sec') > 0]
-    large_avail = [t for t in large_tests if val(df,'tidesdb',t[0],t[1],'duration_sec') > 0 or val(df,'rocksdb',t[0],t[1],'duration_sec') > 0]
+    std_avail = filter_available(df, std_tests, 'duration_sec')
+    large_avail = filter_available(df, large_tests, 'duration_sec')
     
     if not std_avail and not large_avail:
         print('  - 14_duration_comparison.png (no data, skipped)')
@@ -754,15 +921,15 @@ def plot_duration(df):
     if large_avail:
         panels.append((large_avail, 'Large Scale'))
     
-    fig, axes = plt.subplots(1, len(panels), figsize=(9*len(panels), 6))
+    fig, axes = get_fig((9*len(panels), 6), 1, len(panels))
     if len(panels) == 1:
         axes = [axes]
     fig.suptitle('Wall-Clock Duration (sec) — Lower is Better')
     
     for ax, (tests, title) in zip(axes, panels):
         lbl = [t[2] for t in tests]
-        tv = [val(df,'tidesdb',t[0],t[1],'duration_sec') for t in tests]
-        rv = [val(df,'rocksdb',t[0],t[1],'duration_sec') for t in tests]
+        keys = [t[:2] for t in tests]
+        tv, rv = engine_vals(df, keys, 'duration_sec')
         paired_bars(ax, lbl, tv, rv, 'Duration (sec)', title)
     fig.tight_layout(rect=[0,0,1,.93])
     save(fig, '14_duration_comparison.png')
@@ -781,8 +948,8 @@ def plot_cv(df):
                   ('seek_seq_5M_t8','SEEK','Seq Seek'),
                   ('range_random_100_1M_t8','RANGE','Range 100')]
     
-    write_avail = [t for t in write_tests if val(df,'tidesdb',t[0],t[1],'cv_percent') > 0 or val(df,'rocksdb',t[0],t[1],'cv_percent') > 0]
-    read_avail = [t for t in read_tests if val(df,'tidesdb',t[0],t[1],'cv_percent') > 0 or val(df,'rocksdb',t[0],t[1],'cv_percent') > 0]
+    write_avail = filter_available(df, write_tests, 'cv_percent')
+    read_avail = filter_available(df, read_tests, 'cv_percent')
     
     if not write_avail and not read_avail:
         print('  - 15_latency_variability.png (no data, skipped)')
@@ -794,15 +961,15 @@ def plot_cv(df):
     if read_avail:
         panels.append((read_avail, 'Read/Seek Variability'))
     
-    fig, axes = plt.subplots(1, len(panels), figsize=(9*len(panels), 6))
+    fig, axes = get_fig((9*len(panels), 6), 1, len(panels))
     if len(panels) == 1:
         axes = [axes]
     fig.suptitle('Latency Variability (CV%) — Lower is More Consistent')
     
     for ax, (tests, title) in zip(axes, panels):
         lbl = [t[2] for t in tests]
-        tv = [val(df,'tidesdb',t[0],t[1],'cv_percent') for t in tests]
-        rv = [val(df,'rocksdb',t[0],t[1],'cv_percent') for t in tests]
+        keys = [t[:2] for t in tests]
+        tv, rv = engine_vals(df, keys, 'cv_percent')
         paired_bars(ax, lbl, tv, rv, 'CV %', title, decimal=True)
     fig.tight_layout(rect=[0,0,1,.93])
     save(fig, '15_latency_variability.png')
@@ -812,39 +979,115 @@ def plot_cv(df):
 # Plot 16: Synced Write Throughput & Latency
 # ═══════════════════════════════════════════════
 def plot_sync_writes(df):
-    fig, (a1, a2) = plt.subplots(1, 2, figsize=(16, 6))
-    fig.suptitle('Synced (Durable) Write Performance — Scaling')
     tests = [
         ('sync_write_random_25K_t1_b1000', '25K\n1 thread'),
         ('sync_write_random_50K_t4_b1000', '50K\n4 threads'),
         ('sync_write_random_100K_t8_b1000', '100K\n8 threads'),
         ('sync_write_random_500K_t16_b1000', '500K\n16 threads'),
     ]
-    lbl = [t[1] for t in tests]
-    tv = [val(df, 'tidesdb', t[0], 'PUT', 'ops_per_sec') for t in tests]
-    rv = [val(df, 'rocksdb', t[0], 'PUT', 'ops_per_sec') for t in tests]
-    if any(v > 0 for v in tv + rv):
-        paired_bars(a1, lbl, tv, rv, 'ops/sec', 'Throughput (sync=on)', rotation=0)
-        tv = [val(df, 'tidesdb', t[0], 'PUT', 'avg_latency_us') for t in tests]
-        rv = [val(df, 'rocksdb', t[0], 'PUT', 'avg_latency_us') for t in tests]
-        paired_bars(a2, lbl, tv, rv, 'Avg Latency (us)', 'Latency (sync=on)', rotation=0)
-        fig.tight_layout(rect=[0, 0, 1, .93])
-        save(fig, '16_sync_write_performance.png')
-    else:
-        plt.close(fig)
+    keys = [(t[0], 'PUT') for t in tests]
+    tv, rv = engine_vals(df, keys, 'ops_per_sec')
+    # Check for data before touching a figure so the skip path does no layout work
+    if not (tv > 0).any() and not (rv > 0).any():
         print('  - 16_sync_write_performance.png (no sync data found, skipped)')
+        return
+
+    fig, (a1, a2) = get_fig((16, 6), 1, 2)
+    fig.suptitle('Synced (Durable) Write Performance — Scaling')
+    lbl = [t[1] for t in tests]
+    paired_bars(a1, lbl, tv, rv, 'ops/sec', 'Throughput (sync=on)', rotation=0)
+    tv, rv = engine_vals(df, keys, 'avg_latency_us')
+    paired_bars(a2, lbl, tv, rv, 'Avg Latency (us)', 'Latency (sync=on)', rotation=0)
+    fig.tight_layout(rect=[0, 0, 1, .93])
+    save(fig, '16_sync_write_performance.png')
 
 
 # ═══════════════════════════════════════════════
 # Main
 # ═══════════════════════════════════════════════
+PLOTS = [
+    plot_speedup_summary, plot_write_throughput, plot_read_mixed, plot_delete,
+    plot_seek, plot_range, plot_batch_scaling, plot_value_size,
+    plot_latency_overview, plot_latency_percentiles, plot_write_amp, plot_space,
+    plot_resources, plot_tail_latency, plot_duration, plot_cv, plot_sync_writes,
+]
+
+_worker_df = None
+
+
+def _init_worker(df, dpi, input_key):
+    # Spawned workers re-import this module, so carry over what main() set
+    global _worker_df, DPI, _INPUT_KEY
+    _worker_df, DPI, _INPUT_KEY = df, dpi, input_key
+    setup_style()
+
+
+def _run_plot(fn):
+    fn(_worker_df)
+    flush_writes()  # pool workers exit without running atexit hooks
+    gc.collect()  # cleared cached figures leave cyclic artist garbage
+
+
+def render_all(df):
+    """Render every plot, fanning out across worker processes when cores allow."""
+    global _INPUT_KEY
+    _INPUT_KEY = input_key([df], DPI)
+    workers = min(len(PLOTS), os.cpu_count() or 1)
+    # Park the loaded data and modules outside the collector: the per-plot
+    # collections stay cheap and forked workers don't copy-on-write them.
+    gc.collect()
+    gc.freeze()
+    if workers > 1:
+        sys.stdout.flush()  # don't let children replay the parent's buffered output
+        # fork shares the loaded data for free; spawn (macOS/Windows) pickles it
+        # once per worker, which is cheap for the grouped table
+        method = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn'
+        pool = multiprocessing.get_context(method).Pool(
+            workers, initializer=_init_worker, initargs=(df, DPI, _INPUT_KEY))
+        try:
+            pool.map(_run_plot, PLOTS, chunksize=1)
+        finally:
+            pool.close()  # not terminate(): workers must exit cleanly to flush stdout
+            pool.join()
+    else:
+        for fn in PLOTS:
+            fn(df)
+            gc.collect()
+    flush_writes()
+    plt.close('all')
+
+
+def positive_int(text):
+    """argparse type for --dpi: a whole number above zero."""
+    try:
+        n = int(text)
+    except ValueError:
+        n = 0
+    if n <= 0:
+        raise argparse.ArgumentTypeError(f'expected a positive integer, got {text!r}')
+    return n
+
+
+def parse_args(argv):
+    """Set DPI from --dpi N / --dpi=N and return the positional CSV paths."""
+    global DPI
+    parser = argparse.ArgumentParser(usage='python3 plot_tidesdb_rocksdb.py <csv_file> [--dpi N]')
+    parser.add_argument('csv', nargs='*', help=argparse.SUPPRESS)
+    parser.add_argument('--dpi', type=positive_int, default=DPI, metavar='N',
+                        help=f'PNG resolution (default {DPI})')
+    ns = parser.parse_args(argv)
+    DPI = ns.dpi
+    return ns.csv
+
+
 def main():
-    if len(sys.argv) > 1:
-        csv_path = sys.argv[1]
+    args = parse_args(sys.argv[1:])
+    if args:
+        csv_path = args[0]
     else:
         csvs = sorted(glob.glob('tidesdb_rocksdb_benchmark_results_*.csv'))
         if not csvs:
-            print('Usage: python3 plot_tidesdb_rocksdb.py <csv_file>')
+            print('Usage: python3 plot_tidesdb_rocksdb.py <csv_file> [--dpi N]')
             sys.exit(1)
         csv_path = csvs[-1]
 
@@ -854,23 +1097,7 @@ def main():
     setup_style()
 
     print('Generating plots...')
-    plot_speedup_summary(df)
-    plot_write_throughput(df)
-    plot_read_mixed(df)
-    plot_delete(df)
-    plot_seek(df)
-    plot_range(df)
-    plot_batch_scaling(df)
-    plot_value_size(df)
-    plot_latency_overview(df)
-    plot_latency_percentiles(df)
-    plot_write_amp(df)
-    plot_space(df)
-    plot_resources(df)
-    plot_tail_latency(df)
-    plot_duration(df)
-    plot_cv(df)
-    plot_sync_writes(df)
+    render_all(df)
 
     n = len([f for f in os.listdir(OUT_DIR) if f.endswith('.png')])
     print(f'\nDone! {n} plots saved to {OUT_DIR}/')